@@ -1,99 +1,306 @@
 # Injector code from https://github.com/SteamDeckHomebrew/steamdeck-ui-inject. More info on how it works there.
 
-from asyncio import sleep
+from asyncio import Future, Lock, Queue, QueueEmpty, QueueFull, Task, create_task, get_running_loop, sleep, wait_for
+from itertools import count
 from logging import getLogger
-from typing import Any, Callable, List, TypedDict, Dict
+from random import random
+from string import Template
+from time import monotonic
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple, TypeVar, TypedDict, Dict, cast
 
-from aiohttp import ClientSession
-from aiohttp.client_exceptions import ClientConnectorError, ClientOSError
+from aiohttp import ClientSession, ClientTimeout, ClientWebSocketResponse, TCPConnector, WSMsgType
+from aiohttp.client_exceptions import ClientConnectionError, ClientConnectorError, ClientOSError
 from asyncio.exceptions import TimeoutError
+import orjson
 import uuid
 
 BASE_ADDRESS = "http://localhost:8080"
 
 logger = getLogger("Injector")
 
+T = TypeVar("T")
+
+def _backoff_delay(attempt: int, base: float = 0.5, cap: float = 30) -> float:
+    # Exponential backoff with up to 50% jitter, so retries don't line up with each other
+    return min(base * 2 ** attempt, cap) * (1 + random() * 0.5)
+
+async def _with_backoff(coro_factory: Callable[[], Awaitable[T]], *, retries: int = 3, base: float = 0.5, cap: float = 5) -> T:
+    """
+    Awaits a fresh coroutine from `coro_factory`, retrying with backoff on transient connection errors.
+    The last error is raised once `retries` retries have failed.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await coro_factory()
+        except (ClientConnectorError, ConnectionResetError):
+            if attempt >= retries:
+                raise
+            await sleep(_backoff_delay(attempt, base, cap))
+            attempt += 1
+
+# Shared by every Tab websocket and the /json probe, so each call doesn't pay for a new connector
+_session: Optional[ClientSession] = None
+
+def _json_dumps(obj: Any) -> str:
+    # aiohttp wants a str for text frames
+    return orjson.dumps(obj).decode()
+
+async def _get_session() -> ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = ClientSession(connector=TCPConnector(limit=0, force_close=False, enable_cleanup_closed=True))
+    return _session
+
+# Persistent devtools websockets, keyed by tab id. Opened on first use and reused by every Tab instance for that id
+_ws_pool: Dict[str, "_TabConnection"] = {}
+# Kept for the lifetime of the session (one per tab id seen), so callers queued on a lock never race a replacement
+_ws_locks: Dict[str, Lock] = {}
+
+# /json entries by title for get_tab, so bursts of lookups share one probe and only build the Tab they need
+TAB_CACHE_TTL = 1.0
+_tab_cache: Dict[str, Tuple[float, "_TabResponse"]] = {}
+
+def _invalidate_tab_cache(tab_id: str):
+    for title, (_, res) in list(_tab_cache.items()):
+        if res["id"] == tab_id:
+            del _tab_cache[title]
+
+async def shutdown():
+    """
+    Closes the shared client session. Tab websockets opened through it are closed along with it.
+    """
+    global _session
+    _ws_pool.clear()
+    _ws_locks.clear()
+    _tab_cache.clear()
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+# Used by add_script_to_evaluate_on_new_document to hold the script back until the DOM exists
+_DOM_WRAPPER = Template("""
+function scriptFunc() {
+    $js
+}
+if (document.readyState === 'loading') {
+    addEventListener('DOMContentLoaded', () => {
+        scriptFunc();
+    });
+} else {
+    scriptFunc();
+}
+""")
+
+# Shape shared by every Runtime.evaluate command, only the expression and overridden params are filled in per call
+_EVALUATE_CMD: Dict[str, Any] = {
+    "method": "Runtime.evaluate",
+    "params": {
+        "userGesture": True,
+        "awaitPromise": False
+    }
+}
+
+def _evaluate_cmd(expression: str, **params: Any) -> Dict[str, Any]:
+    return {**_EVALUATE_CMD, "params": {**_EVALUATE_CMD["params"], "expression": expression, **params}}
+
+# Installed once per websocket by get_steam_resource (and on every new document after that), so each fetch only has to send the call
+_FETCH_HELPER = "window.__deckyFetch = async (url) => (await fetch(url)).text()"
+
 class _TabResponse(TypedDict):
     title: str
     id: str
     url: str
     webSocketDebuggerUrl: str
 
-class Tab:
-    cmd_id = 0
+# Events nobody listens for are dropped oldest-first past this point
+MAX_QUEUED_EVENTS = 1000
+# How long reload_and_evaluate waits for the reloaded page to hit its breakpoint
+DEBUGGER_PAUSE_TIMEOUT = 10
+
+class _TabConnection:
+    """
+    A pooled devtools websocket along with its background reader, which resolves
+    command responses by id and queues everything else as events.
+    """
+    def __init__(self, tab_id: str, websocket: ClientWebSocketResponse) -> None:
+        self.tab_id = tab_id
+        self.websocket = websocket
+        self.cmd_ids = count(1)
+        self.pending: Dict[int, Future[Dict[str, Any]]] = {}
+        self.events: Queue[Dict[str, Any] | None] = Queue(MAX_QUEUED_EVENTS)
+        # Domains stay enabled for as long as the websocket is open
+        self.enabled_domains: Set[str] = set()
+        self.event_waiters: Dict[str, List[Future[Dict[str, Any]]]] = {}
+        self.fetch_helper_installed = False
+        self.reader: Task[None] = create_task(self._reader())
+
+    def expect_event(self, method: str) -> Future[Dict[str, Any]]:
+        """
+        Returns a future resolved with the next `method` event. Register it before sending whatever triggers the event.
+        """
+        fut: Future[Dict[str, Any]] = get_running_loop().create_future()
+        self.event_waiters.setdefault(method, []).append(fut)
+        return fut
 
+    def put_event(self, data: Dict[str, Any] | None):
+        try:
+            self.events.put_nowait(data)
+        except QueueFull:
+            try:
+                self.events.get_nowait()
+            except QueueEmpty:
+                pass
+            self.events.put_nowait(data)
+
+    async def _reader(self):
+        try:
+            while True:
+                message = await self.websocket.receive()
+                if message.type in (WSMsgType.CLOSE, WSMsgType.CLOSING, WSMsgType.CLOSED):
+                    break
+                if message.type == WSMsgType.ERROR:
+                    logger.warning(f"The websocket for tab {self.tab_id} failed: {self.websocket.exception()}")
+                    break
+                if message.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    parsed: Any = orjson.loads(message.data)
+                except orjson.JSONDecodeError:
+                    logger.warning(f"Ignoring malformed devtools frame from tab {self.tab_id}")
+                    continue
+                if not isinstance(parsed, dict):
+                    logger.warning(f"Ignoring non-object devtools frame from tab {self.tab_id}")
+                    continue
+                data = cast(Dict[str, Any], parsed)
+                if "id" in data:
+                    fut = self.pending.pop(data["id"], None)
+                    if fut and not fut.done():
+                        fut.set_result(data)
+                else:
+                    for fut in self.event_waiters.pop(data.get("method", ""), []):
+                        if not fut.done():
+                            fut.set_result(data)
+                    self.put_event(data)
+        finally:
+            for fut in [*self.pending.values(), *(f for waiters in self.event_waiters.values() for f in waiters)]:
+                if not fut.done():
+                    fut.set_exception(ConnectionResetError(f"Websocket for tab {self.tab_id} closed while waiting for a response"))
+            self.pending.clear()
+            self.event_waiters.clear()
+            if not self.websocket.closed:
+                await self.websocket.close()
+            if _ws_pool.get(self.tab_id) is self:
+                del _ws_pool[self.tab_id]
+            # The tab may be gone along with its socket, so make the next get_tab look it up again
+            _invalidate_tab_cache(self.tab_id)
+            # Wakes up anything waiting in listen_for_message
+            self.put_event(None)
+
+class Tab:
     def __init__(self, res: _TabResponse) -> None:
         self.title: str = res["title"]
         self.id: str = res["id"]
         self.url: str = res["url"]
         self.ws_url: str = res["webSocketDebuggerUrl"]
 
-        self.websocket = None
-        self.client = None
+    @property
+    def websocket(self) -> ClientWebSocketResponse | None:
+        conn = _ws_pool.get(self.id)
+        return conn.websocket if conn else None
+
+    @property
+    def _lock(self) -> Lock:
+        return _ws_locks.setdefault(self.id, Lock())
+
+    async def _acquire_ws(self) -> _TabConnection:
+        async with self._lock:
+            conn = _ws_pool.get(self.id)
+            if conn is None or conn.websocket.closed:
+                session = await _get_session()
+                try:
+                    ws = await _with_backoff(lambda: session.ws_connect(self.ws_url, heartbeat=None, max_msg_size=0))
+                except:
+                    _invalidate_tab_cache(self.id)
+                    raise
+                conn = _ws_pool[self.id] = _TabConnection(self.id, ws)
+            return conn
 
     async def open_websocket(self):
-        self.client = ClientSession()
-        self.websocket = await self.client.ws_connect(self.ws_url)
+        await self._acquire_ws()
 
     async def close_websocket(self):
-        if self.websocket:
-            await self.websocket.close()
-        if self.client:
-            await self.client.close()
+        conn = _ws_pool.pop(self.id, None)
+        if conn:
+            await conn.websocket.close()
 
     async def listen_for_message(self):
-        if self.websocket:
-            async for message in self.websocket:
-                data = message.json()
+        conn = _ws_pool.get(self.id)
+        if conn:
+            while (data := await conn.events.get()) is not None:
                 yield data
+            # Leave the marker in place for any other listener
+            conn.put_event(None)
             logger.warning(f"The Tab {self.title} socket has been disconnected while listening for messages.")
-            await self.close_websocket()
-            
-    async def _send_devtools_cmd(self, dc: Dict[str, Any], receive: bool = True):
-        if self.websocket:
-            self.cmd_id += 1
-            dc["id"] = self.cmd_id
-            await self.websocket.send_json(dc)
-            if receive:
-                async for msg in self.listen_for_message():
-                    if "id" in msg and msg["id"] == dc["id"]:
-                        return msg
+            # Only drop the connection we were reading, another caller may have opened a fresh one since
+            if _ws_pool.get(self.id) is conn:
+                del _ws_pool[self.id]
+            await conn.websocket.close()
+
+    async def _send_on(self, conn: _TabConnection, dc: Dict[str, Any], receive: bool) -> Future[Dict[str, Any]] | None:
+        cmd_id = dc["id"] = next(conn.cmd_ids)
+        if not receive:
+            await conn.websocket.send_json(dc, dumps=_json_dumps)
             return None
-        raise RuntimeError("Websocket not opened")
-
-    async def evaluate_js(self, js: str, run_async: bool | None = False, manage_socket: bool | None = True, get_result: bool = True):
+        fut: Future[Dict[str, Any]] = get_running_loop().create_future()
+        conn.pending[cmd_id] = fut
         try:
-            if manage_socket:
-                await self.open_websocket()
+            await conn.websocket.send_json(dc, dumps=_json_dumps)
+        except:
+            conn.pending.pop(cmd_id, None)
+            raise
+        return fut
 
-            res = await self._send_devtools_cmd({
-                "method": "Runtime.evaluate",
-                "params": {
-                    "expression": js,
-                    "userGesture": True,
-                    "awaitPromise": run_async
-                }
-            }, get_result)
+    async def _send_devtools_cmd(self, dc: Dict[str, Any], receive: bool = True):
+        conn = await self._acquire_ws()
+        try:
+            fut = await self._send_on(conn, dc, receive)
+        except (ConnectionResetError, ClientConnectionError):
+            # The pooled websocket died under us, reconnect and send once more.
+            # Only failed sends are retried, a command that made it out may already have run.
+            logger.warning(f"The Tab {self.title} socket was reset while sending, reconnecting")
+            if _ws_pool.get(self.id) is conn:
+                del _ws_pool[self.id]
+            await conn.websocket.close()
+            conn = await self._acquire_ws()
+            fut = await self._send_on(conn, dc, receive)
+        return await fut if fut else None
+
+    async def evaluate_js(self, js: str, run_async: bool | None = False, manage_socket: bool | None = False, get_result: bool = True):
+        try:
+            res = await self._send_devtools_cmd(_evaluate_cmd(js, awaitPromise=run_async), get_result)
 
         finally:
             if manage_socket:
                 await self.close_websocket()
         return res
 
-    async def has_global_var(self, var_name: str, manage_socket: bool = True):
-        res = await self.evaluate_js(f"window['{var_name}'] !== null && window['{var_name}'] !== undefined", False, manage_socket)
-        assert res is not None
-
-        if not "result" in res or not "result" in res["result"] or not "value" in res["result"]["result"]:
+    async def _evaluate_bool(self, expression: str, manage_socket: bool = False) -> bool:
+        # returnByValue makes the result a plain value, so a failed evaluation is just a missing key
+        try:
+            res = await self._send_devtools_cmd(_evaluate_cmd(expression, returnByValue=True))
+            return res["result"]["result"]["value"] if res else False
+        except (KeyError, TypeError):
             return False
+        finally:
+            if manage_socket:
+                await self.close_websocket()
 
-        return res["result"]["result"]["value"]
+    async def has_global_var(self, var_name: str, manage_socket: bool = False):
+        return await self._evaluate_bool(f"window[{_json_dumps(var_name)}] != null", manage_socket)
 
-    async def close(self, manage_socket: bool = True):
+    async def close(self, manage_socket: bool = False):
         try:
-            if manage_socket:
-                await self.open_websocket()
-
             res = await self._send_devtools_cmd({
                 "method": "Page.close",
             }, False)
@@ -103,27 +310,37 @@ class Tab:
                 await self.close_websocket()
         return res
 
+    async def _ensure_enabled(self, domain: str):
+        conn = await self._acquire_ws()
+        if domain in conn.enabled_domains:
+            return
+        conn.enabled_domains.add(domain)
+        try:
+            await self._send_on(conn, {
+                "method": f"{domain}.enable",
+            }, False)
+        except:
+            conn.enabled_domains.discard(domain)
+            raise
+
     async def enable(self):
         """
         Enables page domain notifications.
         """
-        await self._send_devtools_cmd({
-            "method": "Page.enable",
-        }, False)
+        await self._ensure_enabled("Page")
 
     async def disable(self):
         """
         Disables page domain notifications.
         """
+        conn = await self._acquire_ws()
+        conn.enabled_domains.discard("Page")
         await self._send_devtools_cmd({
             "method": "Page.disable",
         }, False)
 
-    async def refresh(self, manage_socket: bool = True):
+    async def refresh(self, manage_socket: bool = False):
         try:
-            if manage_socket:
-                await self.open_websocket()
-
             await self._send_devtools_cmd({
                 "method": "Page.reload",
             }, False)
@@ -133,74 +350,80 @@ class Tab:
                 await self.close_websocket()
 
         return
-    async def reload_and_evaluate(self, js: str, manage_socket: bool = True):
+    async def reload_and_evaluate(self, js: str, manage_socket: bool = False):
         """
         Reloads the current tab, with JS to run on load via debugger
         """
         try:
-            if manage_socket:
-                await self.open_websocket()
-
-            await self._send_devtools_cmd({
-                "method": "Debugger.enable"
-            }, True)
+            await self._ensure_enabled("Debugger")
 
-            await self._send_devtools_cmd({
-                "method": "Runtime.evaluate",
-                "params": {
-                    "expression": "location.reload();",
-                    "userGesture": True,
-                    "awaitPromise": False
-                }
-            }, False)
+            conn = await self._acquire_ws()
+            paused = conn.expect_event("Debugger.paused")
+            breakpoint_id = None
+            try:
+                # Commands are handled in the order they're sent, so only the breakpoint's response needs waiting on
+                await self._send_devtools_cmd(_evaluate_cmd("location.reload();"), False)
 
-            breakpoint_res = await self._send_devtools_cmd({
-                "method": "Debugger.setInstrumentationBreakpoint",
-                "params": {
-                    "instrumentation": "beforeScriptExecution"
-                }
-            }, True)
-
-            assert breakpoint_res is not None
-
-            logger.info(breakpoint_res)
-            
-            # Page finishes loading when breakpoint hits
-
-            for _ in range(20):
-                # this works around 1/5 of the time, so just send it 8 times.
-                # the js accounts for being injected multiple times allowing only one instance to run at a time anyway
-                await self._send_devtools_cmd({
-                    "method": "Runtime.evaluate",
+                breakpoint_res = await self._send_devtools_cmd({
+                    "method": "Debugger.setInstrumentationBreakpoint",
                     "params": {
-                        "expression": js,
-                        "userGesture": True,
-                        "awaitPromise": False
+                        "instrumentation": "beforeScriptExecution"
                     }
-                }, False)
-
-            await self._send_devtools_cmd({
-                "method": "Debugger.removeBreakpoint",
-                "params": {
-                    "breakpointId": breakpoint_res["result"]["breakpointId"]
-                }
-            }, False)
-
-            for _ in range(4):
+                }, True)
+
+                assert breakpoint_res is not None
+
+                logger.info(breakpoint_res)
+                breakpoint_id = breakpoint_res["result"]["breakpointId"]
+
+                # Page finishes loading when breakpoint hits
+                call_frame_id = None
+                try:
+                    paused_event = await wait_for(paused, DEBUGGER_PAUSE_TIMEOUT)
+                    call_frame_id = paused_event["params"]["callFrames"][0]["callFrameId"]
+                except TimeoutError:
+                    logger.warning(f"The Tab {self.title} never paused on reload, evaluating without the debugger")
+                except (KeyError, IndexError, TypeError):
+                    logger.warning(f"The Tab {self.title} paused without a call frame, evaluating without the debugger")
+
+                if call_frame_id:
+                    await self._send_devtools_cmd({
+                        "method": "Debugger.evaluateOnCallFrame",
+                        "params": {
+                            "callFrameId": call_frame_id,
+                            "expression": js
+                        }
+                    }, False)
+                else:
+                    await self._send_devtools_cmd(_evaluate_cmd(js), False)
+            finally:
+                # Never leave the page held on the breakpoint, that freezes the Steam UI
+                paused.cancel()
+                if breakpoint_id is not None:
+                    await self._send_devtools_cmd({
+                        "method": "Debugger.removeBreakpoint",
+                        "params": {
+                            "breakpointId": breakpoint_id
+                        }
+                    }, False)
+
+                for _ in range(4):
+                    await self._send_devtools_cmd({
+                        "method": "Debugger.resume"
+                    }, False)
+
+                # Left enabled, any `debugger;` statement would pause the shared tab with nothing to resume it
+                conn.enabled_domains.discard("Debugger")
                 await self._send_devtools_cmd({
-                    "method": "Debugger.resume"
-                }, False)
-
-            await self._send_devtools_cmd({
-                "method": "Debugger.disable"
-            }, True)
+                    "method": "Debugger.disable"
+                }, True)
 
         finally:
             if manage_socket:
                 await self.close_websocket()
         return
 
-    async def add_script_to_evaluate_on_new_document(self, js: str, add_dom_wrapper: bool = True, manage_socket: bool = True, get_result: bool = True):
+    async def add_script_to_evaluate_on_new_document(self, js: str, add_dom_wrapper: bool = True, manage_socket: bool = False, get_result: bool = True):
         """
         How the underlying call functions is not particularly clear from the devtools docs, so stealing puppeteer's description:
 
@@ -222,7 +445,7 @@ class Tab:
             DOM will usually not exist when this execution happens,
             so it is necessary to delay til DOM is loaded if you are modifying it
         manage_socket : bool
-            True to have this function handle opening/closing the websocket for this tab
+            True to close this tab's pooled websocket once the call is done
         get_result : bool
             True to wait for the result of this call
 
@@ -235,21 +458,7 @@ class Tab:
         """
         try:
 
-            wrappedjs = """
-            function scriptFunc() {
-                {js}
-            }
-            if (document.readyState === 'loading') {
-                addEventListener('DOMContentLoaded', () => {
-                scriptFunc();
-            });
-            } else {
-                scriptFunc();
-            }
-            """.format(js=js) if add_dom_wrapper else js
-
-            if manage_socket:
-                await self.open_websocket()
+            wrappedjs = _DOM_WRAPPER.substitute(js=js) if add_dom_wrapper else js
 
             res = await self._send_devtools_cmd({
                 "method": "Page.addScriptToEvaluateOnNewDocument",
@@ -263,7 +472,7 @@ class Tab:
                 await self.close_websocket()
         return res
 
-    async def remove_script_to_evaluate_on_new_document(self, script_id: str, manage_socket: bool = True):
+    async def remove_script_to_evaluate_on_new_document(self, script_id: str, manage_socket: bool = False):
         """
         Removes a script from a page that was added with `add_script_to_evaluate_on_new_document`
 
@@ -274,9 +483,6 @@ class Tab:
         """
 
         try:
-            if manage_socket:
-                await self.open_websocket()
-
             await self._send_devtools_cmd({
                 "method": "Page.removeScriptToEvaluateOnNewDocument",
                 "params": {
@@ -288,16 +494,10 @@ class Tab:
             if manage_socket:
                 await self.close_websocket()
 
-    async def has_element(self, element_name: str, manage_socket: bool = True):
-        res = await self.evaluate_js(f"document.getElementById('{element_name}') != null", False, manage_socket)
-        assert res is not None
-
-        if not "result" in res or not "result" in res["result"] or not "value" in res["result"]["result"]:
-            return False
+    async def has_element(self, element_name: str, manage_socket: bool = False):
+        return await self._evaluate_bool(f"document.getElementById({_json_dumps(element_name)}) != null", manage_socket)
 
-        return res["result"]["result"]["value"]
-
-    async def inject_css(self, style: str, manage_socket: bool = True):
+    async def inject_css(self, style: str, manage_socket: bool = False):
         try:
             css_id = str(uuid.uuid4())
 
@@ -329,7 +529,7 @@ class Tab:
                 "result": e
             }
 
-    async def remove_css(self, css_id: str, manage_socket: bool = True):
+    async def remove_css(self, css_id: str, manage_socket: bool = False):
         try:
             result = await self.evaluate_js(
                 f"""
@@ -358,50 +558,96 @@ class Tab:
                 "result": e
             }
 
-    async def get_steam_resource(self, url: str):
-        res = await self.evaluate_js(f'(async function test() {{ return await (await fetch("{url}")).text() }})()', True)
+    async def _install_fetch_helper(self, conn: _TabConnection):
+        # Scripts added this way only live as long as the websocket, hence tracking it on the connection
+        await self._send_on(conn, {
+            "method": "Page.addScriptToEvaluateOnNewDocument",
+            "params": {
+                "source": _FETCH_HELPER
+            }
+        }, False)
+        await self._send_on(conn, _evaluate_cmd(_FETCH_HELPER), False)
+        conn.fetch_helper_installed = True
+
+    async def _call_fetch_helper(self, url: str) -> Dict[str, Any]:
+        res = await self._send_devtools_cmd(_evaluate_cmd(f"window.__deckyFetch({_json_dumps(url)})", awaitPromise=True, returnByValue=True))
         assert res is not None
+        return res
+
+    async def get_steam_resource(self, url: str):
+        conn = await self._acquire_ws()
+        if not conn.fetch_helper_installed:
+            await self._install_fetch_helper(conn)
+        res = await self._call_fetch_helper(url)
+        if "exceptionDetails" in res["result"] and not await self._evaluate_bool('typeof window.__deckyFetch === "function"'):
+            # Only reinstall when the helper is really missing, a failed fetch shouldn't be sent twice
+            await self._install_fetch_helper(await self._acquire_ws())
+            res = await self._call_fetch_helper(url)
+        if "exceptionDetails" in res["result"]:
+            details = res["result"]["exceptionDetails"]
+            raise RuntimeError(f"Failed to fetch {url}: {details.get('exception', {}).get('description', details.get('text'))}")
         return res["result"]["result"]["value"]
 
     def __repr__(self):
         return self.title
 
 
-async def get_tabs() -> List[Tab]:
-    res = {}
+async def _get_tab_responses(max_retries: int = 10) -> List[_TabResponse]:
+    web = await _get_session()
 
     na = False
+    attempt = 0
     while True:
         try:
-            async with ClientSession() as web:
-                res = await web.get(f"{BASE_ADDRESS}/json", timeout=3)
-        except ClientConnectorError:
-            if not na:
-                logger.debug("Steam isn't available yet. Wait for a moment...")
-                na = True
-            await sleep(5)
-        except ClientOSError:
-            logger.warning(f"The request to {BASE_ADDRESS}/json was reset")
-            await sleep(1)
-        except TimeoutError:
-            logger.warning(f"The request to {BASE_ADDRESS}/json timed out")
-            await sleep(1)
-        else:
-            break
-
-    if res.status == 200:
-        r = await res.json()
-        return [Tab(i) for i in r]
-    else:
-        raise Exception(f"/json did not return 200. {await res.text()}")
-
+            async with web.get(f"{BASE_ADDRESS}/json", timeout=ClientTimeout(total=3)) as res:
+                if res.status == 200:
+                    return await res.json(loads=orjson.loads)
+                else:
+                    raise Exception(f"/json did not return 200. {await res.text()}")
+        except (ClientOSError, TimeoutError) as e:
+            if attempt >= max_retries:
+                raise
+            if isinstance(e, ClientConnectorError):
+                if not na:
+                    logger.debug("Steam isn't available yet. Wait for a moment...")
+                    na = True
+            elif isinstance(e, ClientOSError):
+                logger.warning(f"The request to {BASE_ADDRESS}/json was reset")
+            else:
+                logger.warning(f"The request to {BASE_ADDRESS}/json timed out")
+            await sleep(_backoff_delay(attempt))
+            attempt += 1
+
+
+async def get_tabs(max_retries: int = 10) -> List[Tab]:
+    """
+    Fetches the list of tabs from the debugger, retrying with exponential backoff while Steam isn't reachable.
+    The last connection error is raised once `max_retries` retries have failed.
+    """
+    return [Tab(i) for i in await _get_tab_responses(max_retries)]
+
+def _cached_tab_response(tab_name: str) -> _TabResponse | None:
+    cached = _tab_cache.get(tab_name)
+    if not cached:
+        return None
+    timestamp, res = cached
+    if monotonic() - timestamp >= TAB_CACHE_TTL:
+        return None
+    return res
 
 async def get_tab(tab_name: str) -> Tab:
-    tabs = await get_tabs()
-    tab = next((i for i in tabs if i.title == tab_name), None)
-    if not tab:
-        raise ValueError(f"Tab {tab_name} not found")
-    return tab
+    res = _cached_tab_response(tab_name)
+    if not res:
+        responses = await _get_tab_responses()
+        now = monotonic()
+        _tab_cache.clear()
+        # reversed so the first tab with a given title wins, as before
+        for i in reversed(responses):
+            _tab_cache[i["title"]] = (now, i)
+        res = _cached_tab_response(tab_name)
+        if not res:
+            raise ValueError(f"Tab {tab_name} not found")
+    return Tab(res)
 
 async def get_tab_lambda(test: Callable[[Tab], bool]) -> Tab:
     tabs = await get_tabs()
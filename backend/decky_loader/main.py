@@ -11,7 +11,7 @@ if hasattr(sys, '_MEIPASS'):
 # Full imports
 import multiprocessing
 multiprocessing.freeze_support()
-from asyncio import AbstractEventLoop, CancelledError, Task, all_tasks, current_task, gather, new_event_loop, set_event_loop, sleep
+from asyncio import AbstractEventLoop, CancelledError, Task, TimeoutError, all_tasks, current_task, gather, new_event_loop, set_event_loop, sleep
 from logging import basicConfig, getLogger
 from os import path
 from traceback import format_exc
@@ -29,7 +29,7 @@ from .browser import PluginBrowser
 from .helpers import (REMOTE_DEBUGGER_UNIT, create_inject_script, csrf_middleware, get_csrf_token, get_loader_version,
                      mkdir_as_user, get_system_pythonpaths, get_effective_user_id)
                      
-from .injector import get_gamepadui_tab, Tab
+from .injector import get_gamepadui_tab, Tab, shutdown as shutdown_injector
 from .loader import Loader
 from .settings import SettingsManager
 from .updater import Updater
@@ -130,6 +130,8 @@ class PluginManager:
             if self.js_ctx_tab:
                 await self.js_ctx_tab.close_websocket()
                 self.js_ctx_tab = None
+            logger.info("Closing injector session...")
+            await shutdown_injector()
         except:
             logger.info("Error during shutdown:\n" + format_exc())
             pass
@@ -182,7 +184,7 @@ class PluginManager:
                     return
                 try:
                     tab = await get_gamepadui_tab()
-                except (client_exceptions.ClientConnectorError, client_exceptions.ServerDisconnectedError):
+                except (client_exceptions.ClientOSError, client_exceptions.ServerDisconnectedError, TimeoutError):
                     if not dc:
                         logger.debug("Couldn't connect to debugger, waiting...")
                         dc = True
@@ -267,6 +269,11 @@ def main():
 
     logger.info(f"Starting Decky version {get_loader_version()}")
 
-    loop = new_event_loop()
+    try:
+        # uvloop isn't available on Windows
+        import uvloop
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = new_event_loop()
     set_event_loop(loop)
     PluginManager(loop).run()